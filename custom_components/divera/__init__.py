@@ -1,6 +1,7 @@
 """divera component."""
 
 import asyncio
+from typing import Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_NAME, Platform
@@ -21,7 +22,7 @@ from .const import (
 from .coordinator import DiveraCoordinator
 from .divera import DiveraClient, DiveraError
 
-PLATFORMS = [Platform.SELECT, Platform.SENSOR]
+PLATFORMS: Final = (Platform.SELECT, Platform.SENSOR)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -37,7 +38,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     base_url = entry.data.get(DATA_BASE_URL, DIVERA_BASE_URL)
 
     divera_hass_data = hass.data.setdefault(DOMAIN, {})
-    divera_hass_data[entry.entry_id] = {}
+    entry_data = divera_hass_data[entry.entry_id] = {}
 
     websession = async_get_clientsession(hass)
     tasks = []
@@ -45,15 +46,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         divera_coordinator = DiveraCoordinator(
             hass, websession, accesskey, base_url=base_url, ucr_id=ucr_id
         )
-        divera_hass_data[entry.entry_id][ucr_id] = {
-            DATA_DIVERA_COORDINATOR: divera_coordinator
-        }
+        entry_data[ucr_id] = {DATA_DIVERA_COORDINATOR: divera_coordinator}
 
         tasks.append(
-            asyncio.create_task(divera_coordinator.async_config_entry_first_refresh())
+            hass.async_create_task(
+                divera_coordinator.async_config_entry_first_refresh(),
+                name=f"divera_first_refresh_{ucr_id}",
+                eager_start=True,
+            )
         )
 
-    await asyncio.wait(tasks)
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # Stop the remaining first refreshes so no task outlives the
+        # failed setup attempt.
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        raise
 
     entry.async_on_unload(entry.add_update_listener(async_update_listener))
 
@@ -83,14 +94,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         bool: True if unloading was successful, False otherwise.
 
     """
-    unload_ok = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, component)
-                for component in PLATFORMS
-            ]
-        )
-    )
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
         if not hass.data[DOMAIN]:
@@ -110,6 +114,13 @@ async def async_migrate_entry(hass, config_entry: ConfigEntry):
 
     """
 
+    if (
+        config_entry.version == CONF_FLOW_VERSION
+        and config_entry.minor_version == CONF_FLOW_MINOR_VERSION
+    ):
+        # Already on the current schema; skip the migration round-trip.
+        return True
+
     LOGGER.debug("Migrating from version %s", config_entry.version)
 
     if (
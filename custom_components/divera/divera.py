@@ -2,8 +2,11 @@
 
 from datetime import datetime
 from http.client import UNAUTHORIZED
+import logging
+import time
 
 from aiohttp import ClientError, ClientResponseError, ClientSession
+import orjson
 
 from homeassistant.const import STATE_UNKNOWN
 
@@ -27,6 +30,23 @@ from .const import (
 from .utils import remove_params_from_url
 
 
+def _intify_keys(mapping: dict) -> dict:
+    """Return a copy of the mapping with its keys coerced to int.
+
+    The Divera API serializes id-keyed maps with string keys; normalizing
+    them once per pull lets the getters drop the per-lookup str()
+    conversions.
+    """
+    return {int(key): value for key, value in mapping.items()}
+
+
+_VERSION_MAP = {
+    1: VERSION_FREE,
+    2: VERSION_ALARM,
+    3: VERSION_PRO,
+}
+
+
 class DiveraClient:
     """Represents a client for interacting with the Divera API."""
 
@@ -37,6 +57,11 @@ class DiveraClient:
 
         Args:
             session (ClientSession): Client session for making HTTP requests.
+                Pass a long-lived, shared session (e.g. Home Assistant's
+                async_get_clientsession) so requests reuse pooled
+                keep-alive connections instead of paying a TCP/TLS
+                handshake per poll. The client never creates or closes a
+                session itself.
             accesskey (str): Access key for accessing Divera data.
             base_url (str, optional): Base URL for Divera API. Defaults to DIVERA_BASE_URL.
             ucr_id (str, optional): Unique identifier for the organization. Defaults to None.
@@ -44,9 +69,65 @@ class DiveraClient:
         """
         self.__session = session
         self.__data = None
-        self.__accesskey = accesskey
         self.__base_url = base_url
-        self.__ucr_id = ucr_id
+
+        self.__pull_url = base_url + DIVERA_API_PULL_PATH
+        self.__status_url = base_url + DIVERA_API_STATUS_PATH
+        self.__base_params = {PARAM_ACCESSKEY: accesskey}
+        if ucr_id is not None:
+            self.__base_params[PARAM_UCR] = ucr_id
+
+        self.__payload: dict = {}
+        self.__user: dict = {}
+        self.__cluster: dict = {}
+        self.__alarm: dict = {}
+        self.__alarm_items: dict = {}
+        self.__last_alarm: dict | None = None
+        self.__ucr_map: dict = {}
+        self.__group_names: dict = {}
+        self.__status: dict = {}
+        self.__status_sorting: list = []
+        self.__state_id_to_name: dict = {}
+        self.__state_name_to_id: dict = {}
+        self.__state_names: list = []
+        self.__active_ucr_str: str = ""
+        self.__cache: dict = {}
+
+    def __index_data(self) -> None:
+        """Bind the frequently accessed subtrees of the pulled payload.
+
+        The getters previously re-walked the same nested dict chains on
+        every call; binding the hot subtrees once per pull reduces each
+        access to a single attribute read.
+        """
+        self.__cache = {}
+        payload = self.__data["data"]
+        self.__payload = payload
+        self.__user = payload.get("user", {})
+        self.__cluster = payload.get("cluster", {})
+        self.__alarm = payload.get("alarm", {})
+        self.__alarm_items = _intify_keys(self.__alarm.get("items", {}))
+        sorting_list = self.__alarm.get("sorting")
+        self.__last_alarm = (
+            self.__alarm_items.get(sorting_list[0]) if sorting_list else None
+        )
+        self.__ucr_map = _intify_keys(payload.get("ucr", {}))
+        self.__group_names = {
+            int(group_id): group.get("name")
+            for group_id, group in self.__cluster.get("group", {}).items()
+        }
+        self.__status = self.__cluster.get("status", {})
+        self.__status_sorting = self.__cluster.get("statussorting", [])
+        self.__state_id_to_name = {
+            int(state_id): state["name"] for state_id, state in self.__status.items()
+        }
+        self.__state_name_to_id = {
+            state["name"]: int(state_id) for state_id, state in self.__status.items()
+        }
+        self.__state_names = [
+            self.__state_id_to_name[state_id] for state_id in self.__status_sorting
+        ]
+        self.__active_ucr_str = str(payload.get("ucr_active"))
 
     async def pull_data(self):
         """Pull data from the Divera API.
@@ -58,33 +139,41 @@ class DiveraClient:
             DiveraAuthError: If authentication fails while connecting to the Divera API.
 
         """
-        url = "".join([self.__base_url, DIVERA_API_PULL_PATH])
-        time = int(datetime.now().timestamp())
+        now = int(time.time())
         params = {
-            PARAM_ACCESSKEY: self.__accesskey,
-            PARAM_NEWS: time,
-            PARAM_EVENT: time,
-            PARAM_STATUSPLAN: time,
-            PARAM_LOCALMONITOR: time,
-            PARAM_MONITOR: time,
+            **self.__base_params,
+            PARAM_NEWS: now,
+            PARAM_EVENT: now,
+            PARAM_STATUSPLAN: now,
+            PARAM_LOCALMONITOR: now,
+            PARAM_MONITOR: now,
         }
-        if self.__ucr_id is not None:
-            params[PARAM_UCR] = self.__ucr_id
         try:
-            async with self.__session.get(url=url, params=params) as response:
+            async with self.__session.get(
+                url=self.__pull_url, params=params
+            ) as response:
                 response.raise_for_status()
-                self.__data = await response.json()
+                self.__data = orjson.loads(await response.read())
+                self.__index_data()
         except ClientResponseError as exc:
             # TODO Exception Tests
-            url = remove_params_from_url(exc.request_info.url)
-            LOGGER.error(f"Error response {exc.status} while requesting {url!r}.")
+            if LOGGER.isEnabledFor(logging.ERROR):
+                LOGGER.error(
+                    "Error response %s while requesting %r.",
+                    exc.status,
+                    remove_params_from_url(exc.request_info.url),
+                )
             if exc.status == UNAUTHORIZED:
-                raise DiveraAuthError from None
-            raise DiveraConnectionError from None
+                raise DiveraAuthError from exc
+            raise DiveraConnectionError from exc
         except ClientError as exc:
-            url = remove_params_from_url(exc.request_info.url)
-            LOGGER.error(f"An error occurred while requesting {url!r}.")
-            raise DiveraConnectionError from None
+            request_info = getattr(exc, "request_info", None)
+            if LOGGER.isEnabledFor(logging.ERROR) and request_info is not None:
+                LOGGER.error(
+                    "An error occurred while requesting %r.",
+                    remove_params_from_url(request_info.url),
+                )
+            raise DiveraConnectionError from exc
 
     def get_base_url(self) -> str:
         """Get the base URL of the Divera API.
@@ -105,9 +194,8 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        firstname = self.__data["data"]["user"]["firstname"]
-        lastname = self.__data["data"]["user"]["lastname"]
-        return firstname + " " + lastname
+        user = self.__user
+        return user["firstname"] + " " + user["lastname"]
 
     def get_user(self) -> dict:
         """Return information about the user.
@@ -120,11 +208,19 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        data = {}
-        data["firstname"] = self.__data["data"]["user"]["firstname"]
-        data["lastname"] = self.__data["data"]["user"]["lastname"]
-        data["fullname"] = self.get_full_name()
-        data["email"] = self.get_email()
+        if "user" in self.__cache:
+            return self.__cache["user"]
+
+        user = self.__user
+        firstname = user["firstname"]
+        lastname = user["lastname"]
+        data = {
+            "firstname": firstname,
+            "lastname": lastname,
+            "fullname": firstname + " " + lastname,
+            "email": user["email"],
+        }
+        self.__cache["user"] = data
         return data
 
     def get_state_id_by_name(self, name):
@@ -141,12 +237,8 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        for state_id in self.__data["data"]["cluster"]["statussorting"]:
-            state_name = self.__data["data"]["cluster"]["status"][str(state_id)]["name"]
-            if state_name == name:
-                return state_id
         # TODO: raise Error instead of None
-        return None
+        return self.__state_name_to_id.get(name)
 
     def get_all_state_name(self) -> list:
         """Return the list of all available names of the states.
@@ -158,11 +250,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        states = []
-        for state_id in self.__data["data"]["cluster"]["statussorting"]:
-            state_name = self.__data["data"]["cluster"]["status"][str(state_id)]["name"]
-            states.append(state_name)
-        return states
+        return self.__state_names
 
     def get_user_state(self) -> str:
         """Give the name of the current status of the user.
@@ -174,7 +262,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        status_id = self.__data["data"]["status"]["status_id"]
+        status_id = self.__payload["status"]["status_id"]
         return self.get_state_name_by_id(status_id)
 
     def get_state_name_by_id(self, status_id) -> str:
@@ -190,7 +278,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["cluster"]["status"][str(status_id)]["name"]
+        return self.__state_id_to_name[int(status_id)]
 
     def get_user_state_attributes(self) -> dict:
         """Return additional information of the user's state.
@@ -203,10 +291,10 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
+        status = self.__payload["status"]
         data = {}
-        timestamp = self.__data["data"]["status"]["status_set_date"]
-        data["timestamp"] = datetime.fromtimestamp(timestamp)
-        data["id"] = self.__data["data"]["status"]["status_id"]
+        data["timestamp"] = datetime.fromtimestamp(status["status_set_date"])
+        data["id"] = status["status_id"]
         return data
 
     def get_last_alarm_attributes(self) -> dict:
@@ -223,18 +311,18 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        sorting_list = self.__data["data"]["alarm"]["sorting"]
-        if not sorting_list:
-            return {}
+        if "last_alarm_attributes" in self.__cache:
+            return self.__cache["last_alarm_attributes"]
 
-        last_alarm_id = sorting_list[0]
-        alarm = self.__data["data"]["alarm"]["items"].get(str(last_alarm_id), {})
+        alarm = self.__last_alarm
+        if alarm is None:
+            self.__cache["last_alarm_attributes"] = {}
+            return {}
 
-        groups = [
-            self.get_group_name_by_id(group_id) for group_id in alarm.get("group", [])
-        ]
+        group_names = self.__group_names
+        groups = [group_names.get(group_id) for group_id in alarm.get("group", [])]
 
-        return {
+        attributes = {
             "id": alarm.get("id"),
             "text": alarm.get("text"),
             "date": datetime.fromtimestamp(alarm.get("date")),
@@ -248,6 +336,8 @@ class DiveraClient:
             "self_addressed": alarm.get("ucr_self_addressed"),
             "answered": self.get_answered_state(alarm),
         }
+        self.__cache["last_alarm_attributes"] = attributes
+        return attributes
 
     def get_answered_state(self, alarm):
         """Return the state of the user who answered the alarm.
@@ -259,12 +349,9 @@ class DiveraClient:
             str: The state of the user who answered the alarm.
 
         """
-        answered = alarm.get("ucr_answered", {})
-        ucr_id = self.get_active_ucr()
-
-        for state_id in answered:
-            answer = answered.get(state_id)
-            if str(ucr_id) in answer:
+        active_ucr = self.__active_ucr_str
+        for state_id, answer in alarm.get("ucr_answered", {}).items():
+            if active_ucr in answer:
                 return self.get_state_name_by_id(state_id)
         return "not answered"
 
@@ -278,10 +365,8 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        sorting_list = self.__data["data"]["alarm"]["sorting"]
-        if sorting_list:
-            last_alarm_id = sorting_list[0]
-            alarm = self.__data["data"]["alarm"]["items"].get(str(last_alarm_id), {})
+        alarm = self.__last_alarm
+        if alarm is not None:
             return alarm.get("title", STATE_UNKNOWN)
         return STATE_UNKNOWN
 
@@ -299,11 +384,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        try:
-            group = self.__data["data"]["cluster"]["group"][str(group_id)]
-            return group["name"]
-        except KeyError:
-            return None
+        return self.__group_names.get(int(group_id))
 
     def get_default_ucr(self) -> int:
         """Retrieve the default User Cluster Relation (UCR) associated with the data.
@@ -315,7 +396,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["ucr_default"]
+        return self.__payload["ucr_default"]
 
     def get_active_ucr(self) -> int:
         """Retrieve the active User Cluster Relation (UCR) associated with the data.
@@ -327,7 +408,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["ucr_active"]
+        return self.__payload["ucr_active"]
 
     def get_default_cluster_name(self) -> str:
         """Retrieve the name of the default cluster associated with the data.
@@ -352,7 +433,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return len(self.get_all_ucrs())
+        return len(self.__ucr_map)
 
     def get_all_cluster_names(self) -> list:
         """Return a list of all cluster names associated with the data.
@@ -364,12 +445,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        ucr_ids = list(self.__data["data"]["ucr"])
-        cluster_names = []
-        for ucr_id in ucr_ids:
-            ucr_name = self.get_cluster_name_from_ucr(ucr_id)
-            cluster_names.append(ucr_name)
-        return cluster_names
+        return [ucr["name"] for ucr in self.__ucr_map.values()]
 
     def get_all_ucrs(self) -> list:
         """Retrieve a list of all User Cluster Relations (UCRs) associated with the data.
@@ -381,7 +457,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return list(self.__data["data"]["ucr"])
+        return list(self.__ucr_map)
 
     def get_cluster_names_from_ucrs(self, ucr_ids: list[int]) -> list[str]:
         """Get cluster names from a list of UCR IDs.
@@ -408,7 +484,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["ucr"][str(ucr_id)]["name"]
+        return self.__ucr_map[int(ucr_id)]["name"]
 
     def get_cluster_id_from_ucr(self, ucr_id) -> int:
         """Retrieve the ID of the cluster associated with the given User Cluster Relation (UCR) ID.
@@ -423,7 +499,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["ucr"][str(ucr_id)]["cluster_id"]
+        return self.__ucr_map[int(ucr_id)]["cluster_id"]
 
     def get_ucr_ids(self, ucr_names) -> list:
         """Retrieve the IDs of User Cluster Relations (UCRs) associated with the given names.
@@ -438,13 +514,10 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        ucr_ids = list(self.__data["data"]["ucr"])
-        ucr_name_ids = []
-        for ucr_id in ucr_ids:
-            ucr_name = self.get_cluster_name_from_ucr(ucr_id)
-            if ucr_name in ucr_names:
-                ucr_name_ids.append(ucr_id)
-        return ucr_name_ids
+        wanted = set(ucr_names)
+        return [
+            ucr_id for ucr_id, ucr in self.__ucr_map.items() if ucr["name"] in wanted
+        ]
 
     def get_accesskey(self) -> str:
         """Retrieve the access key of the user associated with the data.
@@ -456,7 +529,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["user"]["accesskey"]
+        return self.__user["accesskey"]
 
     def get_email(self) -> str:
         """Retrieve the email of the user associated with the data.
@@ -468,33 +541,35 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["user"]["email"]
+        return self.__user["email"]
 
     async def set_user_state_by_id(self, state_id: int):
         """Set the state of the user to the given id."""
         state = {"Status": {"id": state_id}}
 
-        params = {PARAM_ACCESSKEY: self.__accesskey, PARAM_UCR: self.__ucr_id}
-
-        url = "".join([self.__base_url, DIVERA_API_STATUS_PATH])
-
         try:
             async with self.__session.post(
-                url=url, params=params, json=state
+                url=self.__status_url, params=self.__base_params, json=state
             ) as response:
                 response.raise_for_status()
-        except ClientError as exc:
-            url = remove_params_from_url(exc.request.url)
-            LOGGER.error(f"An error occurred while requesting {url!r}.")
-            raise DiveraConnectionError from None
         except ClientResponseError as exc:
-            url = remove_params_from_url(exc.request.url)
-            LOGGER.error(
-                f"Error response {exc.response.status_code} while requesting {url!r}."
-            )
-            if exc.response.status_code == UNAUTHORIZED:
-                raise DiveraAuthError from None
-            raise DiveraConnectionError from None
+            if LOGGER.isEnabledFor(logging.ERROR):
+                LOGGER.error(
+                    "Error response %s while requesting %r.",
+                    exc.status,
+                    remove_params_from_url(exc.request_info.url),
+                )
+            if exc.status == UNAUTHORIZED:
+                raise DiveraAuthError from exc
+            raise DiveraConnectionError from exc
+        except ClientError as exc:
+            request_info = getattr(exc, "request_info", None)
+            if LOGGER.isEnabledFor(logging.ERROR) and request_info is not None:
+                LOGGER.error(
+                    "An error occurred while requesting %r.",
+                    remove_params_from_url(request_info.url),
+                )
+            raise DiveraConnectionError from exc
 
     def get_cluster_version(self) -> str:
         """Retrieve the version of the cluster.
@@ -510,16 +585,7 @@ class DiveraClient:
             The version_id is extracted from the 'data' dictionary attribute of the instance.
 
         """
-        version = self.__data["data"]["cluster"]["version_id"]
-        match version:
-            case 1:
-                return VERSION_FREE
-            case 2:
-                return VERSION_ALARM
-            case 3:
-                return VERSION_PRO
-            case _:
-                return VERSION_UNKNOWN
+        return _VERSION_MAP.get(self.__cluster["version_id"], VERSION_UNKNOWN)
 
     async def set_user_state_by_name(self, option: str):
         """Set user state by name.
@@ -68,28 +68,8 @@ class DiveraEntity(CoordinatorEntity[DiveraCoordinator]):
             ]
         )
 
-        self._divera_update()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._divera_update()
-        self.async_write_ha_state()
-
-    def _divera_update(self) -> None:
-        raise NotImplementedError
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device information property.
-
-        Returns:
-            DeviceInfo: Device information object.
-
-        """
         # TODO Configuration Url anpassen je nach Divera Server #108
-        config_url = DIVERA_BASE_URL
-        version = self.coordinator.data.get_cluster_version()
-        return DeviceInfo(
+        self._attr_device_info = DeviceInfo(
             identifiers={
                 (
                     DOMAIN,
@@ -98,6 +78,26 @@ class DiveraEntity(CoordinatorEntity[DiveraCoordinator]):
             },
             manufacturer=DIVERA_GMBH,
             name=self._cluster_name,
-            model=version,
-            configuration_url=config_url,
+            model=self.coordinator.data.get_cluster_version(),
+            configuration_url=DIVERA_BASE_URL,
         )
+
+        self._divera_update()
+        self._last_available = self.coordinator.last_update_success
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        changed = self._divera_update()
+        available = self.coordinator.last_update_success
+        if changed or available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
+    def _divera_update(self) -> bool:
+        """Recompute the entity state from coordinator data.
+
+        Returns:
+            bool: True if the state changed, False otherwise.
+
+        """
+        raise NotImplementedError
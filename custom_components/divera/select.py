@@ -13,8 +13,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from . import DiveraCoordinator
-from .const import DATA_DIVERA_COORDINATOR, DATA_UCRS, DOMAIN
+from .const import DATA_DIVERA_COORDINATOR, DOMAIN
 from .divera import DiveraClient, DiveraError
 from .entity import DiveraEntity, DiveraEntityDescription
 
@@ -66,18 +65,16 @@ async def async_setup_entry(
         async_add_entities (AddEntitiesCallback): Function to add entities.
 
     """
-    ucr_ids: list[int] = entry.data[DATA_UCRS]
+    divera_data = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[DiveraSelectEntity] = []
-
-    for ucr_id in ucr_ids:
-        coordinator = hass.data[DOMAIN][entry.entry_id][ucr_id][DATA_DIVERA_COORDINATOR]
-
-        entities.extend(
-            [DiveraSelectEntity(coordinator, description) for description in SENSORS],
-        )
-
-    async_add_entities(entities, False)
+    async_add_entities(
+        (
+            DiveraSelectEntity(ucr_data[DATA_DIVERA_COORDINATOR], description)
+            for ucr_data in divera_data.values()
+            for description in SENSORS
+        ),
+        update_before_add=False,
+    )
 
 
 class DiveraSelectEntity(DiveraEntity, SelectEntity):
@@ -93,29 +90,22 @@ class DiveraSelectEntity(DiveraEntity, SelectEntity):
 
     entity_description: DiveraSelectEntityDescription
 
-    def __init__(
-        self,
-        coordinator: DiveraCoordinator,
-        description: DiveraSelectEntityDescription,
-    ) -> None:
-        """Initialize DiveraSelectEntity.
-
-        Args:
-            coordinator (DiveraCoordinator): The coordinator managing this entity.
-            description (DiveraSelectEntityDescription): Description of the selectable entity.
-
-        """
-        super().__init__(coordinator, description)
-
-    def _divera_update(self) -> None:
-        option = self.entity_description.current_option_fn(self.coordinator.data)
+    def _divera_update(self) -> bool:
+        description = self.entity_description
+        data = self.coordinator.data
+        option = description.current_option_fn(data)
+        options = description.options_fn(data)
+        attributes = description.attribute_fn(data)
+        if (
+            option == getattr(self, "_attr_current_option", None)
+            and options == getattr(self, "_attr_options", None)
+            and attributes == getattr(self, "_attr_extra_state_attributes", None)
+        ):
+            return False
         self._attr_current_option = option
-
-        options = self.entity_description.options_fn(self.coordinator.data)
         self._attr_options = options
-
-        attributes = self.entity_description.attribute_fn(self.coordinator.data)
         self._attr_extra_state_attributes = attributes
+        return True
 
     async def async_select_option(self, option: str) -> None:
         """Select an option asynchronously.
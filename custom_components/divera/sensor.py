@@ -11,8 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from .const import DATA_DIVERA_COORDINATOR, DATA_UCRS, DOMAIN
-from .coordinator import DiveraCoordinator
+from .const import DATA_DIVERA_COORDINATOR, DOMAIN
 from .divera import DiveraClient
 from .entity import DiveraEntity, DiveraEntityDescription
 
@@ -56,18 +55,16 @@ async def async_setup_entry(
         async_add_entities (AddEntitiesCallback): Function to add entities.
 
     """
-    ucr_ids: list[int] = entry.data[DATA_UCRS]
+    divera_data = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[DiveraSensorEntity] = []
-
-    for ucr_id in ucr_ids:
-        coordinator = hass.data[DOMAIN][entry.entry_id][ucr_id][DATA_DIVERA_COORDINATOR]
-
-        entities.extend(
-            [DiveraSensorEntity(coordinator, description) for description in SENSORS],
-        )
-
-    async_add_entities(entities, False)
+    async_add_entities(
+        (
+            DiveraSensorEntity(ucr_data[DATA_DIVERA_COORDINATOR], description)
+            for ucr_data in divera_data.values()
+            for description in SENSORS
+        ),
+        update_before_add=False,
+    )
 
 
 class DiveraSensorEntity(DiveraEntity, SensorEntity):
@@ -83,22 +80,15 @@ class DiveraSensorEntity(DiveraEntity, SensorEntity):
 
     entity_description: DiveraSensorEntityDescription
 
-    def __init__(
-        self,
-        coordinator: DiveraCoordinator,
-        description: DiveraSensorEntityDescription,
-    ) -> None:
-        """Initialize DiveraSensorEntity.
-
-        Args:
-            coordinator (DiveraCoordinator): The coordinator managing this entity.
-            description (DiveraSensorEntityDescription): Description of the sensor entity.
-
-        """
-        super().__init__(coordinator, description)
-
-    def _divera_update(self) -> None:
-        value = self.entity_description.value_fn(self.coordinator.data)
+    def _divera_update(self) -> bool:
+        description = self.entity_description
+        data = self.coordinator.data
+        value = description.value_fn(data)
+        attributes = description.attribute_fn(data)
+        if value == self._attr_native_value and attributes == getattr(
+            self, "_attr_extra_state_attributes", None
+        ):
+            return False
         self._attr_native_value = value
-        attributes = self.entity_description.attribute_fn(self.coordinator.data)
         self._attr_extra_state_attributes = attributes
+        return True